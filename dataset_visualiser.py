@@ -1,6 +1,9 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from lazy_plan import LazyPlan
+from missing_data import fill_missing, iter_fill_missing
+
 # Step 1: Load dataset
 data_path = input("Enter the path to your dataset (CSV file): ")
 try:
@@ -10,6 +13,20 @@ except Exception as e:
     print("❌ Error loading dataset:", e)
     exit()
 
+# Lazy mode records cleaning steps into an optimized plan instead of running them
+lazy = input("Enable lazy mode? (y/n): ").lower() == "y"
+plan = LazyPlan(df) if lazy else None
+
+
+def drop_failing_step(plan, error):
+    """Reports a plan that failed to run and removes its last recorded step."""
+    print("❌ Could not run the plan:", error)
+    if not plan.steps:
+        return plan
+    print("↩️ Dropped the last recorded step:", plan.steps[-1])
+    return LazyPlan(plan.source, plan.steps[:-1], plan.chunksize)
+
+
 # Main CLI Loop
 while True:
     print("\n📊 Pandas Dataset Analysis CLI")
@@ -30,25 +47,37 @@ while True:
     # Step 1
     if choice == "1":
         print(
-            "\n[1] Head\n[2] Tail\n[3] Full\n[4] Shape\n[5] Columns\n[6] Dtypes\n[7] Null Count\n[8] Summary"
+            "\n[1] Head\n[2] Tail\n[3] Full\n[4] Shape\n[5] Columns\n[6] Dtypes\n[7] Null Count\n[8] Summary\n[9] Query Plan (lazy mode)"
         )
-        sub = input("Choose (1–8): ")
+        sub = input("Choose (1–9): ")
+        # Head, columns and dtypes are answered without running the whole plan
+        view = df
+        try:
+            if plan is not None and sub in ("2", "3", "4", "7", "8"):
+                view = plan.collect()
+            elif plan is not None and sub == "1":
+                view = plan.head()
+        except Exception as e:
+            plan = drop_failing_step(plan, e)
+            sub = None
         if sub == "1":
-            print(df.head())
+            print(view.head())
         elif sub == "2":
-            print(df.tail())
+            print(view.tail())
         elif sub == "3":
-            print(df)
+            print(view)
         elif sub == "4":
-            print(df.shape)
+            print(view.shape)
         elif sub == "5":
-            print(df.columns.tolist())
+            print(plan.columns) if plan is not None else print(df.columns.tolist())
         elif sub == "6":
-            print(df.dtypes)
+            print(plan.schema().dtypes) if plan is not None else print(df.dtypes)
         elif sub == "7":
-            print(df.isnull().sum())
+            print(view.isnull().sum())
         elif sub == "8":
-            print(df.describe())
+            print(view.describe())
+        elif sub == "9":
+            print(plan.explain()) if plan is not None else print("Lazy mode is off.")
 
     # Step 2
     elif choice == "2":
@@ -56,34 +85,54 @@ while True:
             "\n[1] One Column\n[2] Multiple Columns\n[3] Condition\n[4] Two Conditions\n[5] iloc/loc"
         )
         sub = input("Choose (1–5): ")
+        view = df
+        try:
+            if plan is not None and sub in ("1", "2", "5"):
+                view = plan.collect()
+        except Exception as e:
+            plan = drop_failing_step(plan, e)
+            sub = None
         if sub == "1":
             col = input("Column: ")
-            print(df[col]) if col in df else print("Invalid column.")
+            print(view[col]) if col in view else print("Invalid column.")
         elif sub == "2":
             cols = input("Columns (comma-separated): ").split(",")
             (
-                print(df[cols])
-                if all(c in df for c in cols)
+                print(view[cols])
+                if all(c in view for c in cols)
                 else print("Invalid column(s).")
             )
         elif sub == "3":
             cond = input("Condition (e.g. Age > 30): ")
             try:
-                print(df.query(cond))
+                # Lazy mode only executes the filter far enough to show a preview
+                (
+                    print(plan.query(cond).head(20))
+                    if plan is not None
+                    else print(df.query(cond))
+                )
             except:
                 print("❌ Invalid query.")
         elif sub == "4":
             cond1 = input("First condition: ")
             cond2 = input("Second condition: ")
             try:
-                print(df.query(f"{cond1} and {cond2}"))
+                (
+                    print(plan.query(f"{cond1} and {cond2}").head(20))
+                    if plan is not None
+                    else print(df.query(f"{cond1} and {cond2}"))
+                )
             except:
                 print("❌ Invalid query.")
         elif sub == "5":
             mode = input("iloc or loc: ").lower()
             start = int(input("Start index: "))
             end = int(input("End index: "))
-            print(df.iloc[start:end]) if mode == "iloc" else print(df.loc[start:end])
+            (
+                print(view.iloc[start:end])
+                if mode == "iloc"
+                else print(view.loc[start:end])
+            )
 
     # Step 3
     elif choice == "3":
@@ -91,7 +140,29 @@ while True:
             "\n[1] Drop Column\n[2] Drop Row\n[3] Rename Column\n[4] Drop Duplicates\n[5] Convert Dtype"
         )
         sub = input("Choose (1–5): ")
-        if sub == "1":
+        if plan is not None:
+            # Lazy mode: record the step; nothing runs until data is viewed
+            try:
+                if sub == "1":
+                    col = input("Column to drop: ")
+                    if col in plan.columns:
+                        plan = plan.drop_columns([col])
+                elif sub == "2":
+                    idx = int(input("Row index: "))
+                    plan = plan.drop_rows([idx])
+                elif sub == "3":
+                    old = input("Old name: ")
+                    new = input("New name: ")
+                    plan = plan.rename({old: new})
+                elif sub == "4":
+                    plan = plan.drop_duplicates()
+                elif sub == "5":
+                    col = input("Column: ")
+                    dtype = input("New dtype (int, float, str): ")
+                    plan = plan.astype(col, dtype)
+            except Exception as e:
+                print("❌ Could not record step:", e)
+        elif sub == "1":
             col = input("Column to drop: ")
             df.drop(columns=col, inplace=True, errors="ignore")
         elif sub == "2":
@@ -115,8 +186,19 @@ while True:
     elif choice == "4":
         col = input("Column to sort by: ")
         asc = input("Ascending (y/n): ").lower() == "y"
-        df.sort_values(by=col, ascending=asc, inplace=True)
-        print(df)
+        if plan is not None:
+            try:
+                plan = plan.sort(col, ascending=asc)
+            except Exception as e:
+                print("❌ Error:", e)
+            else:
+                try:
+                    print(plan.head(20))
+                except Exception as e:
+                    plan = drop_failing_step(plan, e)
+        else:
+            df.sort_values(by=col, ascending=asc, inplace=True)
+            print(df)
 
     # Step 5
     elif choice == "5":
@@ -124,27 +206,82 @@ while True:
         agg_col = input("Aggregate column: ")
         func = input("Function (mean, sum, count, min, max): ")
         try:
-            grouped = df.groupby(group_col)[agg_col].agg(func)
+            if plan is not None:
+                grouped = plan.groupby_agg(group_col, agg_col, func).collect()
+            else:
+                grouped = df.groupby(group_col)[agg_col].agg(func)
             print(grouped)
         except Exception as e:
             print("❌ Error:", e)
 
     # Step 6
     elif choice == "6":
-        print("\n[1] Fill with Value\n[2] Fill with Mean\n[3] Drop Null Rows")
-        sub = input("Choose (1–3): ")
-        if sub == "1":
-            col = input("Column: ")
-            val = input("Value: ")
-            df[col].fillna(val, inplace=True)
-        elif sub == "2":
-            col = input("Column: ")
-            df[col].fillna(df[col].mean(), inplace=True)
-        elif sub == "3":
-            df.dropna(inplace=True)
+        print(
+            "\n[1] Fill with Value\n[2] Fill with Mean\n[3] Drop Null Rows\n[4] Fill with Median\n[5] Fill with Mode\n[6] Forward Fill\n[7] Backward Fill\n[8] Fill with Group Statistic\n[9] Interpolate\n[10] Clean a CSV in Chunks (out-of-core)"
+        )
+        sub = input("Choose (1–10): ")
+        strategies = {
+            "1": "value",
+            "2": "mean",
+            "4": "median",
+            "5": "mode",
+            "6": "ffill",
+            "7": "bfill",
+            "8": "group",
+            "9": "interpolate",
+        }
+        if sub == "3":
+            if plan is not None:
+                plan = plan.dropna()
+            else:
+                df.dropna(inplace=True)
+        elif sub in strategies or sub == "10":
+            strategy = strategies.get(sub)
+            if sub == "10":
+                src_path = input("CSV to clean: ")
+                save_path = input("Save filename (e.g. output.csv): ")
+                strategy = input(
+                    "Strategy (drop, value, mean, median, mode, ffill, bfill, group): "
+                )
+            # Every selected column is handled in one vectorized pass
+            cols = input("Column(s) (comma-separated): ").split(",")
+            cols = [c.strip() for c in cols]
+            options = {}
+            if strategy == "value":
+                options["value"] = input("Value: ")
+            elif strategy == "group":
+                options["group_col"] = input("Group by column: ")
+                options["group_stat"] = input("Statistic (mean, median): ")
+            try:
+                if sub == "10":
+                    chunks = iter_fill_missing(
+                        lambda: pd.read_csv(src_path, chunksize=100_000),
+                        cols,
+                        strategy,
+                        **options,
+                    )
+                    for i, chunk in enumerate(chunks):
+                        chunk.to_csv(
+                            save_path, mode="a" if i else "w", header=not i, index=False
+                        )
+                    print("✅ File cleaned.")
+                elif plan is not None:
+                    plan = plan.fillna(cols, strategy, **options)
+                else:
+                    df = fill_missing(df, cols, strategy, **options)
+            except Exception as e:
+                print("❌ Error:", e)
 
     # Step 7
     elif choice == "7":
+        if plan is not None:
+            # New columns are not part of the plan: apply the pending steps first
+            try:
+                df = plan.collect()
+            except Exception as e:
+                plan = drop_failing_step(plan, e)
+                continue
+            plan = LazyPlan(df)
         print("\n[1] Add col1 + col2\n[2] Apply formula")
         sub = input("Choose (1–2): ")
         if sub == "1":
@@ -167,7 +304,10 @@ while True:
             df2 = pd.read_csv(path2)
             key = input("Join key: ")
             how = input("Join method (inner, left, right, outer): ")
-            df = df.merge(df2, on=key, how=how)
+            if plan is not None:
+                plan = plan.merge(df2, on=key, how=how)
+            else:
+                df = df.merge(df2, on=key, how=how)
             print("✅ Merge complete.")
         except Exception as e:
             print("❌ Merge failed:", e)
@@ -177,19 +317,29 @@ while True:
         print("\n[1] Bar Plot\n[2] Histogram\n[3] Line Plot")
         sub = input("Choose (1–3): ")
         col = input("Column to plot: ")
+        try:
+            view = plan.collect() if plan is not None else df
+        except Exception as e:
+            plan = drop_failing_step(plan, e)
+            continue
         if sub == "1":
-            df[col].value_counts().plot(kind="bar")
+            view[col].value_counts().plot(kind="bar")
         elif sub == "2":
-            df[col].plot(kind="hist")
+            view[col].plot(kind="hist")
         elif sub == "3":
-            df[col].plot(kind="line")
+            view[col].plot(kind="line")
         plt.title(f"{col} Plot")
         plt.show()
 
     # Step 10
     elif choice == "10":
         save_path = input("Save filename (e.g. output.csv): ")
-        df.to_csv(save_path, index=False)
+        try:
+            view = plan.collect() if plan is not None else df
+        except Exception as e:
+            plan = drop_failing_step(plan, e)
+            continue
+        view.to_csv(save_path, index=False)
         print("✅ File exported.")
 
     # Exit
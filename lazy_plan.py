@@ -0,0 +1,392 @@
+import re
+
+import pandas as pd
+
+from missing_data import ORDER_SENSITIVE_STRATEGIES, fill_missing
+
+
+def filter_mask(df, col, op, value):
+    """Returns the boolean mask for `col op value`, casting value if col is numeric."""
+    series = df[col]
+    if op == "contains":
+        return series.astype(str).str.contains(str(value), regex=False, na=False)
+    if pd.api.types.is_numeric_dtype(series):
+        value = float(value)
+    compare = {
+        "==": series.eq,
+        "!=": series.ne,
+        ">": series.gt,
+        ">=": series.ge,
+        "<": series.lt,
+        "<=": series.le,
+    }
+    if op not in compare:
+        raise ValueError(f"Unsupported filter operator: {op}")
+    return compare[op](value)
+
+
+class PlanStep:
+    """A single recorded operation in a LazyPlan."""
+
+    def __init__(self, op, **params):
+        self.op = op
+        self.params = params
+
+    def __repr__(self):
+        args = []
+        for key, value in self.params.items():
+            if isinstance(value, pd.DataFrame):
+                value = f"<DataFrame {value.shape[0]}x{value.shape[1]}>"
+            else:
+                value = repr(value)
+            args.append(f"{key}={value}")
+        return f"{self.op}({', '.join(args)})"
+
+
+class LazyPlan:
+    """
+    Records cleaning and manipulation steps against a source DataFrame as a
+    logical plan instead of running them eagerly. The plan is optimized before
+    execution, and only the requested page (or a full export) is computed.
+
+    Plans are immutable: every builder method returns a new LazyPlan.
+    """
+
+    # Steps that work row by row, so a plan made only of these can run chunked
+    STREAMABLE_OPS = {
+        "project",
+        "filter",
+        "fillna",
+        "dropna",
+        "drop_rows",
+        "rename",
+        "astype",
+    }
+    # Steps that change which rows exist (so the row count must be computed)
+    ROW_CHANGING_OPS = {
+        "filter",
+        "dropna",
+        "drop_rows",
+        "drop_duplicates",
+        "merge",
+        "groupby_agg",
+    }
+    # Steps whose result depends on the incoming row order
+    ORDER_SENSITIVE_OPS = {"drop_duplicates"}
+    ORDER_INSENSITIVE_AGGS = {"mean", "sum", "count", "min", "max"}
+
+    def __init__(self, source, steps=None, chunksize=50_000):
+        self.source = source
+        self.steps = list(steps or [])
+        self.chunksize = chunksize
+        self._optimized = None
+        self._notes = []
+        self._result = None
+        self._schema = None
+
+    # --- Building ---
+
+    def _with(self, step):
+        plan = LazyPlan(self.source, self.steps + [step], self.chunksize)
+        plan.schema()  # Validates the step against the current columns
+        return plan
+
+    def drop_columns(self, columns):
+        return self._with(PlanStep("project", drop=list(columns)))
+
+    def query(self, expr):
+        return self._with(PlanStep("filter", expr=expr))
+
+    def filter(self, col, op, value):
+        return self._with(PlanStep("filter", col=col, cmp=op, value=value))
+
+    def fillna(self, columns, strategy="value", **options):
+        """Fills NAs in `columns`; see missing_data.fill_missing() for the options."""
+        if strategy == "drop":
+            return self.dropna(subset=columns)
+        return self._with(
+            PlanStep("fillna", columns=list(columns), strategy=strategy, **options)
+        )
+
+    def dropna(self, subset=None):
+        return self._with(PlanStep("dropna", subset=subset))
+
+    def drop_rows(self, labels):
+        return self._with(PlanStep("drop_rows", labels=list(labels)))
+
+    def rename(self, mapping):
+        return self._with(PlanStep("rename", mapping=dict(mapping)))
+
+    def astype(self, col, dtype):
+        plan = self._with(PlanStep("astype", col=col, dtype=dtype))
+        # The empty schema can't catch casts that fail on values (e.g. int with
+        # NaNs). That is only checked early when the column is still the
+        # source's; otherwise the failure surfaces when the plan runs.
+        if self._is_source_column(col):
+            self.source[col].astype(dtype)
+        return plan
+
+    def sort(self, by, ascending=True):
+        return self._with(PlanStep("sort", by=by, ascending=ascending))
+
+    def drop_duplicates(self):
+        return self._with(PlanStep("drop_duplicates"))
+
+    def merge(self, right, on, how="inner"):
+        return self._with(
+            PlanStep("merge", right=right, on=on, how=how, right_drop=[])
+        )
+
+    def groupby_agg(self, by, col, func):
+        return self._with(PlanStep("groupby_agg", by=by, col=col, func=func))
+
+    def _is_source_column(self, col):
+        """True if no step so far changes the values or rows of `col`."""
+        for step in self.steps:
+            p = step.params
+            if step.op == "rename":
+                touched = col in p["mapping"] or col in p["mapping"].values()
+            elif step.op in ("fillna", "astype"):
+                touched = col in p.get("columns", [p.get("col")])
+            else:
+                touched = step.op not in ("project", "sort")
+            if touched:
+                return False
+        return col in self.source
+
+    # --- Execution ---
+
+    @staticmethod
+    def _apply(df, step):
+        p = step.params
+        if step.op == "project":
+            return df.drop(columns=p["drop"])
+        if step.op == "filter":
+            if "expr" in p:
+                return df.query(p["expr"])
+            return df[filter_mask(df, p["col"], p["cmp"], p["value"])]
+        if step.op == "fillna":
+            return fill_missing(df, **p)
+        if step.op == "dropna":
+            return df.dropna(subset=p["subset"])
+        if step.op == "drop_rows":
+            return df.drop(index=p["labels"], errors="ignore")
+        if step.op == "rename":
+            return df.rename(columns=p["mapping"])
+        if step.op == "astype":
+            return df.astype({p["col"]: p["dtype"]})
+        if step.op == "sort":
+            # Stable, so pushing a filter below the sort keeps tied rows in order
+            return df.sort_values(by=p["by"], ascending=p["ascending"], kind="stable")
+        if step.op == "drop_duplicates":
+            return df.drop_duplicates()
+        if step.op == "merge":
+            right = p["right"]
+            if p["right_drop"]:
+                right = right.drop(columns=p["right_drop"])
+            return df.merge(right, on=p["on"], how=p["how"])
+        if step.op == "groupby_agg":
+            return df.groupby(p["by"])[p["col"]].agg(p["func"]).reset_index()
+        raise ValueError(f"Unknown plan step: {step.op}")
+
+    def _apply_steps(self, df, steps):
+        for step in steps:
+            df = self._apply(df, step)
+        return df
+
+    def _is_streamable(self, steps):
+        # Of the fills, only a constant value works chunk by chunk
+        return all(
+            s.op in self.STREAMABLE_OPS and s.params.get("strategy", "value") == "value"
+            for s in steps
+        )
+
+    def _iter_chunks(self, steps):
+        for start in range(0, len(self.source), self.chunksize):
+            chunk = self.source.iloc[start : start + self.chunksize]
+            yield self._apply_steps(chunk, steps)
+
+    def schema(self):
+        """Returns an empty DataFrame with the plan's output columns and dtypes."""
+        if self._schema is None:
+            self._schema = self._apply_steps(self.source.iloc[:0], self.steps)
+        return self._schema
+
+    @property
+    def columns(self):
+        return list(self.schema().columns)
+
+    def collect(self):
+        """Executes the optimized plan over the whole source (e.g. for export)."""
+        if self._result is None:
+            self._result = self._apply_steps(self.source, self.optimized_steps())
+        return self._result
+
+    def execute_page(self, start, stop):
+        """
+        Returns rows [start, stop) of the plan's result. Row-wise plans are
+        streamed through the source in chunks until the page is filled.
+        """
+        steps = self.optimized_steps()
+        if self._result is not None or not self._is_streamable(steps):
+            return self.collect().iloc[start:stop]
+        pieces = []
+        seen = 0
+        for chunk in self._iter_chunks(steps):
+            if seen + len(chunk) > start:
+                pieces.append(chunk.iloc[max(start - seen, 0) : stop - seen])
+            seen += len(chunk)
+            if seen >= stop:
+                break
+        if not pieces:
+            return self.schema()
+        return pd.concat(pieces)
+
+    def head(self, n=5):
+        return self.execute_page(0, n)
+
+    def count_rows(self):
+        steps = self.optimized_steps()
+        if not any(s.op in self.ROW_CHANGING_OPS for s in steps):
+            return len(self.source)
+        if self._result is None and self._is_streamable(steps):
+            return sum(len(chunk) for chunk in self._iter_chunks(steps))
+        return len(self.collect())
+
+    # --- Optimization ---
+
+    def optimized_steps(self):
+        if self._optimized is None:
+            self._optimized, self._notes = self._optimize(self.steps)
+        return self._optimized
+
+    def _columns_before(self, steps, i):
+        return list(self._apply_steps(self.source.iloc[:0], steps[:i]).columns)
+
+    @staticmethod
+    def _filter_columns(step, columns):
+        """Returns the columns a filter reads, or None if that can't be determined."""
+        if "col" in step.params:
+            return {step.params["col"]}
+        names = set()
+        tokens = re.findall(r"`([^`]+)`|([A-Za-z_]\w*)", step.params["expr"])
+        for quoted, bare in tokens:
+            names.add(quoted or bare)
+        if "index" in names and "index" not in columns:
+            return None  # Depends on the row labels, which a merge resets
+        return names & set(columns)
+
+    def _uses_row_labels(self, steps, i):
+        """True if a step after steps[i] looks rows up by their index labels."""
+        for j in range(i + 1, len(steps)):
+            step = steps[j]
+            if step.op == "drop_rows":
+                return True
+            if step.op == "filter" and (
+                self._filter_columns(step, self._columns_before(steps, j)) is None
+            ):
+                return True
+        return False
+
+    def _push_down(self, steps, i):
+        """
+        Tries to move the filter/projection at steps[i + 1] below the sort or
+        merge at steps[i]. Returns the rewritten steps, or None.
+        """
+        upper, lower = steps[i], steps[i + 1]
+        if upper.op == "sort":
+            if lower.op == "filter" or upper.params["by"] not in lower.params["drop"]:
+                return steps[:i] + [lower, upper] + steps[i + 2 :]
+            return None
+
+        # upper is a merge: only push what belongs to one side of the join
+        p = upper.params
+        left_cols = set(self._columns_before(steps, i))
+        right_cols = set(p["right"].columns) - set(p["right_drop"]) - {p["on"]}
+        if lower.op == "filter":
+            if p["how"] not in ("inner", "left"):
+                return None  # Filtering the left side would change unmatched rows
+            if self._uses_row_labels(steps, i + 1):
+                return None  # The merge renumbers rows, so labels would shift
+            # Names are resolved against the merge output, so suffixed columns
+            # (e.g. a_x) count as unknown on the left side and block the push
+            needed = self._filter_columns(lower, self._columns_before(steps, i + 1))
+            if not needed or not needed <= left_cols - right_cols:
+                return None
+            return steps[:i] + [lower, upper] + steps[i + 2 :]
+
+        drop = lower.params["drop"]
+        left_only = [c for c in drop if c in left_cols - right_cols and c != p["on"]]
+        right_only = [c for c in drop if c in right_cols - left_cols]
+        if not left_only and not right_only:
+            return None
+        rest = [c for c in drop if c not in left_only and c not in right_only]
+        merge = PlanStep("merge", **dict(p, right_drop=p["right_drop"] + right_only))
+        rewritten = [PlanStep("project", drop=left_only)] if left_only else []
+        rewritten.append(merge)
+        if rest:
+            rewritten.append(PlanStep("project", drop=rest))
+        return steps[:i] + rewritten + steps[i + 2 :]
+
+    def _sort_is_irrelevant(self, steps, i):
+        """True if a later groupby consumes the sort before any order-sensitive step."""
+        for step in steps[i + 1 :]:
+            if step.op == "groupby_agg":
+                return step.params["func"] in self.ORDER_INSENSITIVE_AGGS
+            if step.op in self.ORDER_SENSITIVE_OPS:
+                return False
+            if step.params.get("strategy") in ORDER_SENSITIVE_STRATEGIES:
+                return False
+        return False
+
+    def _optimize(self, steps):
+        steps = list(steps)
+        notes = []
+        changed = True
+        while changed:
+            changed = False
+            for i, step in enumerate(steps):
+                nxt = steps[i + 1] if i + 1 < len(steps) else None
+                if step.op == "project" and nxt is not None and nxt.op == "project":
+                    drop = step.params["drop"] + [
+                        c for c in nxt.params["drop"] if c not in step.params["drop"]
+                    ]
+                    steps[i : i + 2] = [PlanStep("project", drop=drop)]
+                    notes.append(f"merged projections into {steps[i]}")
+                elif step.op == "sort" and self._sort_is_irrelevant(steps, i):
+                    del steps[i]
+                    notes.append(f"elided {step}: a later groupby ignores row order")
+                elif (
+                    step.op in ("sort", "merge")
+                    and nxt is not None
+                    and nxt.op in ("filter", "project")
+                ):
+                    rewritten = self._push_down(steps, i)
+                    if rewritten is None:
+                        continue
+                    steps = rewritten
+                    notes.append(f"pushed {nxt} before {step.op}")
+                else:
+                    continue
+                changed = True
+                break
+        return steps, notes
+
+    def explain(self):
+        """Returns a readable description of the logical and optimized plans."""
+        optimized = self.optimized_steps()
+        rows, cols = self.source.shape
+        lines = [f"Source: DataFrame {rows}x{cols}", "", "Logical plan:"]
+        lines += [f"  {n}. {s}" for n, s in enumerate(self.steps, 1)] or ["  (empty)"]
+        lines += ["", "Optimized plan:"]
+        lines += [f"  {n}. {s}" for n, s in enumerate(optimized, 1)] or ["  (empty)"]
+        if self._notes:
+            lines += ["", "Rewrites:"]
+            lines += [f"  - {note}" for note in self._notes]
+        streamed = self._is_streamable(optimized)
+        lines += [
+            "",
+            "Execution: "
+            + ("streamed in chunks" if streamed else "materialized once, then paged"),
+        ]
+        return "\n".join(lines)
@@ -5,18 +5,28 @@ import math
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+from lazy_plan import LazyPlan, filter_mask
+from missing_data import GROUP_STATS, fill_missing
+from sparse_pivot import sparse_pivot
+from sqlite_store import SQLiteStore
+
 
 class DatasetVisualizerApp(tk.Tk):
     """
     A full-featured GUI application for loading, analyzing, cleaning,
     and visualizing CSV datasets using pandas and tkinter.
-    Includes pagination for efficient large dataset display.
+    Includes pagination for efficient large dataset display, and an optional
+    SQLite-backed storage mode for datasets too large to keep in memory and a
+    lazy mode that records cleaning steps as an optimized plan.
     """
 
     def __init__(self):
         super().__init__()
         self.df = None
         self.df_display = None  # DataFrame currently being shown in the treeview
+        self.store = None  # SQLiteStore used instead of self.df in on-disk mode
+        self.lazy_plan = None  # LazyPlan over self.df while lazy mode is on
+        self.plan_display = None  # LazyPlan currently being shown in the treeview
         self.title("Dataset Visualizer")
         self.geometry("1200x800")
 
@@ -24,6 +34,9 @@ class DatasetVisualizerApp(tk.Tk):
         self.current_page = 1
         self.rows_per_page = 500
         self.total_pages = 1
+        self.store_view = False  # True when pages are served from self.store
+        self.page_keys = [None]  # Keyset cursor at the start of each visited page
+        self.page_source = None  # Store (or StorePivot) serving the keyset pages
 
         # Apply a modern theme
         self.style = ttk.Style(self)
@@ -39,6 +52,7 @@ class DatasetVisualizerApp(tk.Tk):
 
         self._create_menu()
         self._create_widgets()
+        self.protocol("WM_DELETE_WINDOW", self.on_exit)
 
     def _create_menu(self):
         """Creates the main menu bar for the application."""
@@ -48,9 +62,22 @@ class DatasetVisualizerApp(tk.Tk):
         file_menu = tk.Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Load CSV", command=self.load_csv)
+        file_menu.add_command(
+            label="Load CSV into SQLite Store", command=self.load_csv_sqlite
+        )
         file_menu.add_command(label="Export to CSV", command=self.export_csv)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
+        file_menu.add_command(label="Exit", command=self.on_exit)
+
+        mode_menu = tk.Menu(menu_bar, tearoff=0)
+        menu_bar.add_cascade(label="Mode", menu=mode_menu)
+        self.lazy_mode_var = tk.BooleanVar(value=False)
+        mode_menu.add_checkbutton(
+            label="Lazy Cleaning Mode",
+            variable=self.lazy_mode_var,
+            command=self.toggle_lazy_mode,
+        )
+        mode_menu.add_command(label="Show Query Plan", command=self.show_query_plan)
 
     def _create_widgets(self):
         """Creates the main layout and widgets of the application."""
@@ -120,39 +147,45 @@ class DatasetVisualizerApp(tk.Tk):
         parent.add(tab, text="Info")
 
         ttk.Button(
-            tab, text="Dataset Head", command=lambda: self.show_df_info(self.df.head())
+            tab,
+            text="Dataset Head",
+            command=lambda: self.show_df_info(self._summary("head")),
         ).pack(fill="x", pady=5)
         ttk.Button(
-            tab, text="Dataset Tail", command=lambda: self.show_df_info(self.df.tail())
+            tab,
+            text="Dataset Tail",
+            command=lambda: self.show_df_info(self._summary("tail")),
         ).pack(fill="x", pady=5)
         # --- MODIFIED: Button now sets up pagination ---
         ttk.Button(
             tab,
             text="Show Full Dataset",
-            command=lambda: self.setup_pagination(self.df),
+            command=self.show_full_dataset,
         ).pack(fill="x", pady=5)
         ttk.Button(
             tab,
             text="Shape",
             command=lambda: self.show_message(
                 "Dataset Shape",
-                f"Rows: {self.df.shape[0]}, Columns: {self.df.shape[1]}",
+                "Rows: {}, Columns: {}".format(*(self._summary("shape") or (0, 0))),
             ),
         ).pack(fill="x", pady=5)
         ttk.Button(
             tab,
             text="Data Types",
-            command=lambda: self.show_df_info(self.df.dtypes, "Data Types"),
+            command=lambda: self.show_df_info(self._summary("dtypes"), "Data Types"),
         ).pack(fill="x", pady=5)
         ttk.Button(
             tab,
             text="Null Value Count",
-            command=lambda: self.show_df_info(self.df.isnull().sum(), "Null Values"),
+            command=lambda: self.show_df_info(self._summary("nulls"), "Null Values"),
         ).pack(fill="x", pady=5)
         ttk.Button(
             tab,
             text="Summary Statistics",
-            command=lambda: self.show_df_info(self.df.describe(), "Summary Statistics"),
+            command=lambda: self.show_df_info(
+                self._summary("describe"), "Summary Statistics"
+            ),
         ).pack(fill="x", pady=5)
 
     # ... (other _create_*_tab methods remain the same) ...
@@ -171,19 +204,41 @@ class DatasetVisualizerApp(tk.Tk):
             fill="x", pady=(15, 5)
         )
         ttk.Label(tab, text="Handle Missing Data:").pack(fill="x", pady=(15, 0))
-        self.na_col_var = tk.StringVar()
-        self.na_col_combo = ttk.Combobox(tab, textvariable=self.na_col_var)
-        self.na_col_combo.pack(fill="x", pady=5)
+        # Several columns can be selected; the action is applied to all at once
+        self.na_cols_list = tk.Listbox(
+            tab, selectmode="extended", exportselection=False, height=5
+        )
+        self.na_cols_list.pack(fill="x", pady=5)
         self.na_method_var = tk.StringVar(value="drop")
-        ttk.Radiobutton(
-            tab, text="Drop Rows with NA", variable=self.na_method_var, value="drop"
-        ).pack(anchor="w")
+        for text, value in [
+            ("Drop Rows with NA", "drop"),
+            ("Fill with Mean (numeric only)", "mean"),
+            ("Fill with Median (numeric only)", "median"),
+            ("Fill with Mode", "mode"),
+            ("Forward Fill", "ffill"),
+            ("Backward Fill", "bfill"),
+            ("Interpolate (numeric only)", "interpolate"),
+        ]:
+            ttk.Radiobutton(
+                tab, text=text, variable=self.na_method_var, value=value
+            ).pack(anchor="w")
         ttk.Radiobutton(
             tab,
-            text="Fill with Mean (numeric only)",
+            text="Fill with Group Statistic, grouped by:",
             variable=self.na_method_var,
-            value="mean",
+            value="group",
         ).pack(anchor="w")
+        self.na_group_col_var = tk.StringVar()
+        self.na_group_col_combo = ttk.Combobox(
+            tab, textvariable=self.na_group_col_var
+        )
+        self.na_group_col_combo.pack(fill="x", padx=20, pady=2)
+        self.na_group_stat_var = tk.StringVar()
+        self.na_group_stat_combo = ttk.Combobox(
+            tab, textvariable=self.na_group_stat_var, values=list(GROUP_STATS)
+        )
+        self.na_group_stat_combo.pack(fill="x", padx=20, pady=2)
+        self.na_group_stat_combo.set("median")
         ttk.Radiobutton(
             tab,
             text="Fill with Custom Value",
@@ -212,6 +267,21 @@ class DatasetVisualizerApp(tk.Tk):
             tab, text="Descending", variable=self.sort_order_var, value="desc"
         ).pack(anchor="w")
         ttk.Button(tab, text="Sort", command=self.sort_data).pack(fill="x", pady=5)
+        ttk.Label(tab, text="Filter Rows:").pack(fill="x", pady=(15, 0))
+        self.filter_col_var = tk.StringVar()
+        self.filter_col_combo = ttk.Combobox(tab, textvariable=self.filter_col_var)
+        self.filter_col_combo.pack(fill="x", pady=2)
+        self.filter_op_var = tk.StringVar()
+        self.filter_op_combo = ttk.Combobox(
+            tab,
+            textvariable=self.filter_op_var,
+            values=list(SQLiteStore.FILTER_OPS),
+        )
+        self.filter_op_combo.pack(fill="x", pady=2)
+        self.filter_op_combo.set("==")
+        self.filter_value_entry = ttk.Entry(tab)
+        self.filter_value_entry.pack(fill="x", pady=2)
+        ttk.Button(tab, text="Filter", command=self.filter_rows).pack(fill="x", pady=5)
         ttk.Label(tab, text="Group & Aggregate:").pack(fill="x", pady=(15, 0))
         ttk.Label(tab, text="Group by Column:").pack(fill="x")
         self.group_col_var = tk.StringVar()
@@ -233,6 +303,31 @@ class DatasetVisualizerApp(tk.Tk):
         ttk.Button(
             tab, text="Group and Aggregate", command=self.group_and_aggregate
         ).pack(fill="x", pady=5)
+        ttk.Label(tab, text="Pivot:").pack(fill="x", pady=(15, 0))
+        ttk.Label(tab, text="Row Key(s):").pack(fill="x")
+        self.pivot_rows_list = tk.Listbox(
+            tab, selectmode="extended", exportselection=False, height=4
+        )
+        self.pivot_rows_list.pack(fill="x", pady=2)
+        ttk.Label(tab, text="Column Key:").pack(fill="x")
+        self.pivot_col_var = tk.StringVar()
+        self.pivot_col_combo = ttk.Combobox(tab, textvariable=self.pivot_col_var)
+        self.pivot_col_combo.pack(fill="x", pady=2)
+        ttk.Label(tab, text="Value Column:").pack(fill="x")
+        self.pivot_val_var = tk.StringVar()
+        self.pivot_val_combo = ttk.Combobox(tab, textvariable=self.pivot_val_var)
+        self.pivot_val_combo.pack(fill="x", pady=2)
+        self.pivot_func_var = tk.StringVar()
+        self.pivot_func_combo = ttk.Combobox(
+            tab,
+            textvariable=self.pivot_func_var,
+            values=["mean", "sum", "count", "min", "max"],
+        )
+        self.pivot_func_combo.pack(fill="x", pady=2)
+        self.pivot_func_combo.set("sum")
+        ttk.Button(tab, text="Build Pivot", command=self.pivot_data).pack(
+            fill="x", pady=5
+        )
 
     def _create_viz_tab(self, parent):
         """Creates the 'Visualization' tab for plotting data."""
@@ -287,9 +382,14 @@ class DatasetVisualizerApp(tk.Tk):
             return
         try:
             self.df = pd.read_csv(file_path)
+            self._close_store()
             self.update_all_comboboxes()
             # --- MODIFIED: Use pagination to show the first page on load ---
-            self.setup_pagination(self.df)
+            if self.lazy_mode_var.get():
+                self.lazy_plan = LazyPlan(self.df)
+                self.setup_lazy_pagination(self.lazy_plan)
+            else:
+                self.setup_pagination(self.df)
             self.update_status(
                 f"Loaded {file_path} successfully. Shape: {self.df.shape}"
             )
@@ -297,8 +397,84 @@ class DatasetVisualizerApp(tk.Tk):
             messagebox.showerror("Error", f"Failed to load file: {e}")
             self.update_status(f"Error loading {file_path}")
 
+    def load_csv_sqlite(self):
+        """Loads a CSV into an on-disk SQLite store instead of a DataFrame."""
+        file_path = filedialog.askopenfilename(
+            filetypes=[("CSV Files", "*.csv"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+        store = None
+        try:
+            self.update_status(f"Loading {file_path} into SQLite store...")
+            store = SQLiteStore()
+            store.load_csv(file_path)
+            self._close_store()
+            self.store = store
+            self.df = None
+            self.lazy_plan = None
+            self.lazy_mode_var.set(False)
+            self.update_all_comboboxes()
+            self.setup_store_pagination()
+            self.update_status(
+                f"Loaded {file_path} into SQLite store. Shape: {self.store.shape()}"
+            )
+        except Exception as e:
+            if store is not None and store is not self.store:
+                store.close()  # Removes the partially written temporary database
+            messagebox.showerror("Error", f"Failed to load file: {e}")
+            self.update_status(f"Error loading {file_path}")
+
+    def _close_store(self):
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+        self.store_view = False
+        self.page_source = None
+
+    def on_exit(self):
+        """Deletes the SQLite store's temporary database before quitting."""
+        self._close_store()
+        self.quit()
+
+    def _has_data(self):
+        return self.df is not None or self.store is not None
+
+    def _current_df(self):
+        """Returns the in-memory data, executing the lazy plan if one is pending."""
+        if self.lazy_plan is not None:
+            return self.lazy_plan.collect()
+        return self.df
+
+    def toggle_lazy_mode(self):
+        """Switches between eager cleaning and recording steps into a LazyPlan."""
+        if self.store is not None:
+            self.lazy_mode_var.set(False)
+            messagebox.showinfo(
+                "Lazy Mode", "The SQLite store already executes steps in SQL."
+            )
+            return
+        if self.lazy_mode_var.get():
+            if self.df is not None:
+                self.lazy_plan = LazyPlan(self.df)
+                self.setup_lazy_pagination(self.lazy_plan)
+            self.update_status("Lazy mode on: cleaning steps are recorded, not run.")
+        else:
+            if self.lazy_plan is not None:
+                self.df = self.lazy_plan.collect()
+                self.lazy_plan = None
+                self.update_all_comboboxes()
+                self.setup_pagination(self.df)
+            self.update_status("Lazy mode off: recorded steps have been applied.")
+
+    def show_query_plan(self):
+        if self.lazy_plan is None:
+            messagebox.showinfo("Query Plan", "Turn on lazy mode to record a plan.")
+            return
+        self.show_df_info(self.lazy_plan.explain(), "Query Plan")
+
     def export_csv(self):
-        if self.df is None:
+        if not self._has_data():
             messagebox.showwarning("Warning", "No data to export.")
             return
         file_path = filedialog.asksaveasfilename(
@@ -307,7 +483,10 @@ class DatasetVisualizerApp(tk.Tk):
         if not file_path:
             return
         try:
-            self.df.to_csv(file_path, index=False)
+            if self.store is not None:
+                self.store.export_csv(file_path)
+            else:
+                self._current_df().to_csv(file_path, index=False)
             messagebox.showinfo("Success", f"Data exported to {file_path}")
             self.update_status(f"Exported data to {file_path}")
         except Exception as e:
@@ -337,14 +516,58 @@ class DatasetVisualizerApp(tk.Tk):
             return
 
         self.df_display = df
+        self.plan_display = None
+        self.store_view = False
         self.current_page = 1
         self.total_pages = math.ceil(len(self.df_display) / self.rows_per_page)
 
         self.pagination_frame.pack(side="bottom", fill="x")  # Show the controls
         self.display_page()
 
+    def setup_store_pagination(self, source=None):
+        """
+        Initializes keyset pagination over the SQLite store's current view, or
+        over `source` (e.g. a StorePivot) when given.
+        """
+        if self.store is None:
+            messagebox.showwarning("Warning", "No data to display.")
+            return
+
+        self.df_display = None
+        self.plan_display = None
+        self.store_view = True
+        self.current_page = 1
+        self.page_keys = [None]
+        self.page_source = source or self.store
+        self.total_rows = self.page_source.row_count()
+        self.total_pages = math.ceil(self.total_rows / self.rows_per_page)
+
+        self.pagination_frame.pack(side="bottom", fill="x")  # Show the controls
+        self.display_page()
+
+    def setup_lazy_pagination(self, plan):
+        """
+        Initializes pagination over a LazyPlan (or a SparsePivot); only the
+        visible page is executed via plan.execute_page().
+        """
+        self.df_display = None
+        self.plan_display = plan
+        self.store_view = False
+        self.current_page = 1
+        self.total_rows = plan.count_rows()
+        self.total_pages = math.ceil(self.total_rows / self.rows_per_page)
+
+        self.pagination_frame.pack(side="bottom", fill="x")  # Show the controls
+        self.display_page()
+
     def display_page(self):
         """Calculates the slice of data for the current page and displays it."""
+        if self.store_view:
+            self._display_store_page()
+            return
+        if self.plan_display is not None:
+            self._display_lazy_page()
+            return
         if self.df_display is None:
             return
 
@@ -358,6 +581,40 @@ class DatasetVisualizerApp(tk.Tk):
             f"Displaying rows {start_row+1}-{min(end_row, len(self.df_display))} of {len(self.df_display)}"
         )
 
+    def _display_store_page(self):
+        """Fetches the current page from the store by keyset, not by offset."""
+        after_key = self.page_keys[self.current_page - 1]
+        page_df, last_key = self.page_source.fetch_page(
+            after_key, self.rows_per_page
+        )
+        if len(self.page_keys) == self.current_page:
+            self.page_keys.append(last_key)
+
+        start_row = (self.current_page - 1) * self.rows_per_page
+        self._populate_treeview(page_df)
+        self.update_pagination_controls()
+        end_row = start_row + len(page_df)
+        self.update_status(
+            f"Displaying rows {start_row+1}-{end_row} of {self.total_rows}"
+        )
+
+    def _display_lazy_page(self):
+        """Executes the plan for the current page's rows only."""
+        start_row = (self.current_page - 1) * self.rows_per_page
+        end_row = start_row + self.rows_per_page
+        try:
+            page_df = self.plan_display.execute_page(start_row, end_row)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to execute plan: {e}")
+            return
+
+        self._populate_treeview(page_df)
+        self.update_pagination_controls()
+        end_row = start_row + len(page_df)
+        self.update_status(
+            f"Displaying rows {start_row+1}-{end_row} of {self.total_rows}"
+        )
+
     def update_pagination_controls(self):
         """Updates the state of pagination buttons and label."""
         self.page_label.config(text=f"Page {self.current_page} of {self.total_pages}")
@@ -377,22 +634,71 @@ class DatasetVisualizerApp(tk.Tk):
             self.current_page -= 1
             self.display_page()
 
+    def show_full_dataset(self):
+        if self.store is not None:
+            self.store.clear_filter()
+            self.setup_store_pagination()
+        elif self.lazy_plan is not None:
+            self.setup_lazy_pagination(self.lazy_plan)
+        else:
+            self.setup_pagination(self.df)
+
     # --- Other Methods ---
 
     def update_all_comboboxes(self):
-        if self.df is None:
+        if not self._has_data():
             return
-        columns = list(self.df.columns)
+        if self.store is not None:
+            columns = list(self.store.columns)
+        elif self.lazy_plan is not None:
+            columns = self.lazy_plan.columns
+        else:
+            columns = list(self.df.columns)
         self.drop_col_combo["values"] = columns
-        self.na_col_combo["values"] = columns
+        self.na_cols_list.delete(0, tk.END)
+        self.na_cols_list.insert(tk.END, *columns)
+        self.na_group_col_combo["values"] = columns
         self.sort_col_combo["values"] = columns
+        self.filter_col_combo["values"] = columns
         self.group_col_combo["values"] = columns
         self.agg_col_combo["values"] = columns
+        self.pivot_rows_list.delete(0, tk.END)
+        self.pivot_rows_list.insert(tk.END, *columns)
+        self.pivot_col_combo["values"] = columns
+        self.pivot_val_combo["values"] = columns
         self.plot_x_combo["values"] = columns
         self.plot_y_combo["values"] = columns
 
-    def show_df_info(self, content, title="Information"):
+    def _summary(self, kind):
+        """Returns a dataset summary from the store or the in-memory DataFrame."""
+        if self.store is not None:
+            return {
+                "head": self.store.head,
+                "tail": self.store.tail,
+                "shape": self.store.shape,
+                "dtypes": self.store.dtypes,
+                "nulls": self.store.null_counts,
+                "describe": self.store.describe,
+            }[kind]()
         if self.df is None:
+            return None
+        if self.lazy_plan is not None and kind in ("head", "dtypes"):
+            # Answered without running the full plan
+            if kind == "head":
+                return self.lazy_plan.head()
+            return self.lazy_plan.schema().dtypes
+        df = self._current_df()
+        return {
+            "head": df.head,
+            "tail": df.tail,
+            "shape": lambda: df.shape,
+            "dtypes": lambda: df.dtypes,
+            "nulls": lambda: df.isnull().sum(),
+            "describe": df.describe,
+        }[kind]()
+
+    def show_df_info(self, content, title="Information"):
+        if not self._has_data():
             messagebox.showwarning("Warning", "Please load a dataset first.")
             return
         info_window = tk.Toplevel(self)
@@ -404,23 +710,56 @@ class DatasetVisualizerApp(tk.Tk):
         text_area.config(state="disabled")
 
     def show_message(self, title, message):
-        if self.df is None:
+        if not self._has_data():
             messagebox.showwarning("Warning", "Please load a dataset first.")
             return
         messagebox.showinfo(title, message)
 
     # --- MODIFIED: Analysis Functions to use Pagination ---
 
+    def _record_step(self, build, message):
+        """Adds a step to the lazy plan via `build(plan)` and refreshes the view."""
+        try:
+            self.lazy_plan = build(self.lazy_plan)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not record step: {e}")
+            return
+        self.update_all_comboboxes()
+        self.setup_lazy_pagination(self.lazy_plan)  # Refresh view
+        self.update_status(f"{message} (lazy; see Mode > Show Query Plan)")
+
     def drop_column(self):
         col_to_drop = self.drop_col_var.get()
         if not col_to_drop:
             return
+        if self.store is not None:
+            self.store.drop_column(col_to_drop)
+            self.update_all_comboboxes()
+            self.setup_store_pagination()  # Refresh view
+            self.update_status(f"Dropped column: {col_to_drop}")
+            return
+        if self.lazy_plan is not None:
+            self._record_step(
+                lambda plan: plan.drop_columns([col_to_drop]),
+                f"Dropped column: {col_to_drop}",
+            )
+            return
         self.df.drop(columns=[col_to_drop], inplace=True)
         self.update_all_comboboxes()
         self.setup_pagination(self.df)  # Refresh view
         self.update_status(f"Dropped column: {col_to_drop}")
 
     def drop_duplicates(self):
+        if self.store is not None:
+            rows_dropped = self.store.drop_duplicates()
+            self.setup_store_pagination()  # Refresh view
+            self.update_status(f"Dropped {rows_dropped} duplicate rows.")
+            return
+        if self.lazy_plan is not None:
+            self._record_step(
+                lambda plan: plan.drop_duplicates(), "Dropped duplicate rows"
+            )
+            return
         if self.df is None:
             return
         initial_rows = len(self.df)
@@ -430,48 +769,123 @@ class DatasetVisualizerApp(tk.Tk):
         self.update_status(f"Dropped {rows_dropped} duplicate rows.")
 
     def handle_missing_data(self):
-        # This function now also refreshes the view using pagination
-        if self.df is None:
+        # Applies one NA strategy to all selected columns in a single pass
+        if not self._has_data():
             return
-        col = self.na_col_var.get()
+        cols = [self.na_cols_list.get(i) for i in self.na_cols_list.curselection()]
         method = self.na_method_var.get()
-        if not col:
+        if not cols:
+            return
+        options = {}
+        if method == "value":
+            options["value"] = self.na_fill_value_entry.get()
+            if not options["value"]:
+                messagebox.showerror("Error", "Please enter a value to fill.")
+                return
+        elif method == "group":
+            options["group_col"] = self.na_group_col_var.get()
+            options["group_stat"] = self.na_group_stat_var.get()
+            if not options["group_col"]:
+                messagebox.showerror("Error", "Please select a column to group by.")
+                return
+        message = f"Applied '{method}' NA action to {len(cols)} column(s)"
+        if self.store is not None:
+            self._handle_missing_data_store(cols, method, options)
+            return
+        if self.lazy_plan is not None:
+            self._record_step(
+                lambda plan: plan.fillna(cols, method, **options), message
+            )
             return
+        try:
+            self.df = fill_missing(self.df, cols, method, **options)
+            self.setup_pagination(self.df)  # Refresh view
+            self.update_status(f"{message}.")
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {e}")
+
+    def _handle_missing_data_store(self, cols, method, options):
+        """Applies the NA action to all columns with a single UPDATE/DELETE."""
         try:
             if method == "drop":
-                self.df.dropna(subset=[col], inplace=True)
-            elif method == "mean":
-                if pd.api.types.is_numeric_dtype(self.df[col]):
-                    self.df[col].fillna(self.df[col].mean(), inplace=True)
-                else:
+                self.store.drop_na(cols)
+            elif method == "value":
+                self.store.fill_na(dict.fromkeys(cols, options["value"]))
+            elif method in ("mean", "median", "mode"):
+                non_numeric = [c for c in cols if not self.store.is_numeric(c)]
+                if method != "mode" and non_numeric:
                     messagebox.showerror(
-                        "Error", "Mean can only be calculated for numeric columns."
+                        "Error",
+                        f"'{method}' can only be used on numeric columns: "
+                        f"{', '.join(non_numeric)}",
                     )
                     return
-            elif method == "value":
-                fill_val = self.na_fill_value_entry.get()
-                if not fill_val:
-                    messagebox.showerror("Error", "Please enter a value to fill.")
-                    return
-                self.df[col].fillna(fill_val, inplace=True)
-            self.setup_pagination(self.df)  # Refresh view
+                self.store.fill_na(self.store.column_stats(cols, method))
+            else:
+                messagebox.showerror(
+                    "Error",
+                    f"'{method}' is not available for the SQLite store. "
+                    "Load the CSV in memory to use it.",
+                )
+                return
+            self.setup_store_pagination()  # Refresh view
+            self.update_status(
+                f"Applied '{method}' NA action to {len(cols)} column(s)."
+            )
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}")
 
     def sort_data(self):
-        if self.df is None:
+        if not self._has_data():
             return
         col = self.sort_col_var.get()
         order = self.sort_order_var.get() == "asc"
         if not col:
             return
+        if self.store is not None:
+            # Sorting only changes the page order; the index keeps paging cheap
+            self.store.set_sort(col, ascending=order)
+            self.store.clear_filter()
+            self.setup_store_pagination()  # Refresh view
+            self.update_status(
+                f"Sorted data by '{col}' ({self.sort_order_var.get()})."
+            )
+            return
+        if self.lazy_plan is not None:
+            self._record_step(
+                lambda plan: plan.sort(col, ascending=order),
+                f"Sorted data by '{col}' ({self.sort_order_var.get()})",
+            )
+            return
         self.df.sort_values(by=col, ascending=order, inplace=True)
         self.setup_pagination(self.df)  # Refresh view
         self.update_status(f"Sorted data by '{col}' ({self.sort_order_var.get()}).")
 
+    def filter_rows(self):
+        """Displays only the rows matching the filter; the data itself is unchanged."""
+        if not self._has_data():
+            return
+        col = self.filter_col_var.get()
+        op = self.filter_op_var.get()
+        value = self.filter_value_entry.get()
+        if not col or not op:
+            return
+        try:
+            if self.store is not None:
+                self.store.set_filter(col, op, value)
+                self.setup_store_pagination()
+            elif self.lazy_plan is not None:
+                # A view over the plan: the filter is not recorded into it
+                self.setup_lazy_pagination(self.lazy_plan.filter(col, op, value))
+            else:
+                self.setup_pagination(self.df[filter_mask(self.df, col, op, value)])
+            self.update_status(f"Filtered rows where {col} {op} {value}.")
+        except Exception as e:
+            messagebox.showerror("Error", f"Filter failed: {e}")
+
     def group_and_aggregate(self):
         # MODIFIED: Now shows the result in the main paginated view
-        if self.df is None:
+        if not self._has_data():
             return
         group_col = self.group_col_var.get()
         agg_col = self.agg_col_var.get()
@@ -479,14 +893,55 @@ class DatasetVisualizerApp(tk.Tk):
         if not all([group_col, agg_col, func]):
             return
         try:
-            result_df = self.df.groupby(group_col)[agg_col].agg(func).reset_index()
+            if self.store is not None:
+                # Pushed down as SQL GROUP BY; only the aggregated result is in memory
+                result_df = self.store.group_aggregate(group_col, agg_col, func)
+            elif self.lazy_plan is not None:
+                # The groupby lets the optimizer drop any recorded sorts
+                plan = self.lazy_plan.groupby_agg(group_col, agg_col, func)
+                result_df = plan.collect()
+            else:
+                result_df = self.df.groupby(group_col)[agg_col].agg(func).reset_index()
             self.setup_pagination(result_df)  # Display the aggregated result
             self.update_status(f"Aggregation complete. Displaying result.")
         except Exception as e:
             messagebox.showerror("Error", f"Aggregation failed: {e}")
 
+    def pivot_data(self):
+        """Builds a sparse pivot and pages through its non-empty cells."""
+        if not self._has_data():
+            return
+        row_keys = [
+            self.pivot_rows_list.get(i) for i in self.pivot_rows_list.curselection()
+        ]
+        col_key = self.pivot_col_var.get()
+        val_col = self.pivot_val_var.get()
+        func = self.pivot_func_var.get()
+        if not row_keys or not all([col_key, val_col, func]):
+            messagebox.showerror(
+                "Error", "Please select row key(s), a column key and a value column."
+            )
+            return
+        try:
+            if self.store is not None:
+                pivot = self.store.pivot(row_keys, col_key, val_col, func)
+                self.setup_store_pagination(pivot)  # Reads one page of cells at a time
+                self.update_status(
+                    f"Pivot complete: {self.total_rows} non-empty cells."
+                )
+                return
+            pivot = sparse_pivot(self._current_df(), row_keys, col_key, val_col, func)
+            self.setup_lazy_pagination(pivot)  # Decodes one page of cells at a time
+            n_rows, n_cols = pivot.shape
+            self.update_status(
+                f"Pivot complete: {n_rows} x {n_cols} with {pivot.nnz} non-empty "
+                f"cells ({pivot.density:.4%} dense)."
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Pivot failed: {e}")
+
     def generate_plot(self):
-        if self.df is None:
+        if not self._has_data():
             return
         plot_type = self.plot_type_var.get()
         x_col = self.plot_x_var.get()
@@ -504,14 +959,17 @@ class DatasetVisualizerApp(tk.Tk):
             self.canvas.get_tk_widget().pack(fill="both", expand=True)
         self.ax.clear()
         try:
-            if plot_type == "Bar":
-                self.df[x_col].value_counts().nlargest(20).plot(kind="bar", ax=self.ax)
+            df = self._current_df()
+            if self.store is not None:
+                self._plot_from_store(plot_type, x_col, y_col)
+            elif plot_type == "Bar":
+                df[x_col].value_counts().nlargest(20).plot(kind="bar", ax=self.ax)
             elif plot_type == "Histogram":
-                self.df[x_col].plot(kind="hist", bins=30, ax=self.ax)
+                df[x_col].plot(kind="hist", bins=30, ax=self.ax)
             elif plot_type == "Line":
-                self.df.plot(kind="line", x=x_col, y=y_col, ax=self.ax)
+                df.plot(kind="line", x=x_col, y=y_col, ax=self.ax)
             elif plot_type == "Scatter":
-                self.df.plot(kind="scatter", x=x_col, y=y_col, ax=self.ax)
+                df.plot(kind="scatter", x=x_col, y=y_col, ax=self.ax)
             self.ax.set_title(f"{plot_type} Plot")
             self.ax.tick_params(axis="x", rotation=45)
             self.fig.tight_layout()
@@ -519,6 +977,25 @@ class DatasetVisualizerApp(tk.Tk):
         except Exception as e:
             messagebox.showerror("Plotting Error", f"Could not generate plot: {e}")
 
+    def _plot_from_store(self, plot_type, x_col, y_col):
+        """
+        Draws a plot from the SQLite store, binning and counting in SQL. Line
+        and scatter plots use a sample of rows taken in SQL.
+        """
+        if plot_type == "Bar":
+            self.store.value_counts(x_col, 20).plot(kind="bar", ax=self.ax)
+        elif plot_type == "Histogram":
+            counts, edges = self.store.histogram(x_col, bins=30)
+            self.ax.hist(edges[:-1], bins=edges, weights=counts)
+        elif plot_type == "Line":
+            self.store.read_columns([x_col, y_col]).plot(
+                kind="line", x=x_col, y=y_col, ax=self.ax
+            )
+        elif plot_type == "Scatter":
+            self.store.read_columns([x_col, y_col]).plot(
+                kind="scatter", x=x_col, y=y_col, ax=self.ax
+            )
+
 
 if __name__ == "__main__":
     app = DatasetVisualizerApp()
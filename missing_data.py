@@ -0,0 +1,226 @@
+import pandas as pd
+
+STAT_STRATEGIES = ("mean", "median", "mode")
+FILL_STRATEGIES = (
+    "drop",
+    "mean",
+    "median",
+    "mode",
+    "value",
+    "ffill",
+    "bfill",
+    "group",
+    "interpolate",
+)
+GROUP_STATS = ("mean", "median")
+# Strategies whose result depends on the order of the rows
+ORDER_SENSITIVE_STRATEGIES = ("ffill", "bfill", "interpolate")
+
+
+def _require_numeric(df, columns, strategy):
+    non_numeric = [c for c in columns if not pd.api.types.is_numeric_dtype(df[c])]
+    if non_numeric:
+        names = ", ".join(non_numeric)
+        raise ValueError(f"'{strategy}' can only be used on numeric columns: {names}")
+
+
+def _coerce_value(value, dtype):
+    """Casts a (typed-in) fill value to a number when filling a numeric column."""
+    if isinstance(value, str) and pd.api.types.is_numeric_dtype(dtype):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
+
+
+def column_stats(df, columns, stat):
+    """Computes one statistic for many columns in a single vectorized call."""
+    if stat == "mode":
+        modes = df[columns].mode()
+        if modes.empty:
+            return pd.Series(index=columns, dtype=object)
+        return modes.iloc[0]  # Smallest mode when there is a tie, as in pandas
+    return df[columns].agg(stat)
+
+
+def fill_missing(
+    df,
+    columns,
+    strategy,
+    value=None,
+    group_col=None,
+    group_stat="median",
+    interpolate_method="linear",
+):
+    """
+    Handles missing data in many columns at once and returns a new DataFrame.
+    Every fill strategy builds one dict or frame of fill values and applies it
+    with a single fillna() call, so no per-column copies are made.
+    """
+    columns = list(columns)
+    if strategy not in FILL_STRATEGIES:
+        raise ValueError(f"Unsupported strategy: {strategy}")
+    if strategy == "drop":
+        return df.dropna(subset=columns)
+
+    if strategy == "value":
+        fill = {c: _coerce_value(value, df[c].dtype) for c in columns}
+    elif strategy in STAT_STRATEGIES:
+        if strategy != "mode":
+            _require_numeric(df, columns, strategy)
+        fill = column_stats(df, columns, strategy).to_dict()
+    elif strategy in ("ffill", "bfill"):
+        fill = getattr(df[columns], strategy)()
+    elif strategy == "group":
+        if group_stat not in GROUP_STATS:
+            raise ValueError(f"Unsupported group statistic: {group_stat}")
+        if group_col is None or group_col in columns:
+            raise ValueError("Group-wise fill needs a separate group column.")
+        _require_numeric(df, columns, group_stat)
+        fill = df[columns].groupby(df[group_col]).transform(group_stat)
+    else:  # interpolate
+        _require_numeric(df, columns, strategy)
+        fill = df[columns].interpolate(method=interpolate_method)
+    return df.fillna(fill)
+
+
+# --- Chunked (out-of-core) Processing ---
+
+
+def _median_from_counts(counts):
+    """Exact median of a column given its value counts."""
+    counts = counts.sort_index()
+    total = counts.sum()
+    if total == 0:
+        return float("nan")
+    cumulative = counts.cumsum().to_numpy()
+    values = counts.index.to_numpy()
+    lo = values[cumulative.searchsorted((total - 1) // 2, side="right")]
+    hi = values[cumulative.searchsorted(total // 2, side="right")]
+    return (lo + hi) / 2
+
+
+def _stat_from_counts(counts, stat):
+    """Median or mode (smallest on ties) from value counts; NaN if there are none."""
+    if counts is None or counts.sum() == 0:
+        return float("nan")  # All-null column, or no chunks at all
+    if stat == "median":
+        return _median_from_counts(counts)
+    return counts.sort_index().idxmax()
+
+
+def _add(acc, part):
+    return part if acc is None else acc.add(part, fill_value=0)
+
+
+def _chunked_stats(chunks, columns, strategy, group_col, group_stat):
+    """
+    First pass over the chunks: merges per-chunk partial results into the fill
+    values for stat and group strategies. Means combine sums and counts;
+    medians and modes combine value counts, so they are exact.
+    """
+    stat = group_stat if strategy == "group" else strategy
+    sums = counts = None
+    value_counts = dict.fromkeys(columns)
+    for chunk in chunks:
+        if stat != "mode":
+            _require_numeric(chunk, columns, stat)
+        if strategy == "group":
+            if stat == "mean":
+                grouped = chunk.groupby(group_col)[columns]
+                sums, counts = _add(sums, grouped.sum()), _add(counts, grouped.count())
+            else:
+                for c in columns:
+                    part = chunk.groupby(group_col)[c].value_counts()
+                    value_counts[c] = _add(value_counts[c], part)
+        elif stat == "mean":
+            sums = _add(sums, chunk[columns].sum())
+            counts = _add(counts, chunk[columns].count())
+        else:
+            for c in columns:
+                value_counts[c] = _add(value_counts[c], chunk[c].value_counts())
+
+    if strategy == "group":
+        if stat == "mean":
+            return pd.DataFrame(columns=columns) if sums is None else sums / counts
+        return pd.DataFrame(
+            {
+                c: value_counts[c]
+                .groupby(level=0)
+                .apply(lambda s: _median_from_counts(s.droplevel(0)))
+                for c in columns
+                if value_counts[c] is not None
+            },
+            columns=columns,
+        )
+    if stat == "mean":
+        if sums is None:  # No chunks at all
+            return pd.Series(float("nan"), index=columns)
+        return sums / counts
+    return pd.Series({c: _stat_from_counts(value_counts[c], stat) for c in columns})
+
+
+def _iter_bfill(chunks, columns):
+    """
+    Backward-fills across chunk boundaries. A chunk is held back until the
+    first valid values of a later chunk have filled its trailing gaps.
+    """
+    pending = []
+    for chunk in chunks:
+        chunk = chunk.fillna(chunk[columns].bfill())
+        first = chunk[columns].iloc[0] if len(chunk) else None
+        if first is not None:
+            pending = [p.fillna(first.dropna()) for p in pending]
+        pending.append(chunk)
+        while len(pending) > 1 and not pending[0][columns].isna().any().any():
+            yield pending.pop(0)
+    yield from pending
+
+
+def iter_fill_missing(
+    make_chunks, columns, strategy, value=None, group_col=None, group_stat="median"
+):
+    """
+    Chunked version of fill_missing() for data that does not fit in memory.
+    `make_chunks` returns a fresh iterator of DataFrame chunks (e.g. a
+    pd.read_csv(..., chunksize=...) call); stat strategies read it twice.
+    Yields the processed chunks in order.
+    """
+    columns = list(columns)
+    if strategy == "interpolate":
+        raise ValueError("Interpolation needs the whole column; run it unchunked.")
+    if strategy not in FILL_STRATEGIES:
+        raise ValueError(f"Unsupported strategy: {strategy}")
+
+    if strategy == "bfill":
+        yield from _iter_bfill(make_chunks(), columns)
+        return
+
+    stats = None
+    if strategy in STAT_STRATEGIES or strategy == "group":
+        if strategy == "group" and group_stat not in GROUP_STATS:
+            raise ValueError(f"Unsupported group statistic: {group_stat}")
+        stats = _chunked_stats(make_chunks(), columns, strategy, group_col, group_stat)
+
+    carry = None  # Last valid values seen so far, for forward fill
+    for chunk in make_chunks():
+        if strategy == "drop":
+            yield chunk.dropna(subset=columns)
+        elif strategy == "value":
+            yield fill_missing(chunk, columns, "value", value=value)
+        elif strategy == "ffill":
+            fill = chunk[columns].ffill()
+            if carry is not None:
+                fill = fill.fillna(carry)
+            if len(fill):
+                carry = fill.iloc[-1]
+            yield chunk.fillna(fill)
+        elif strategy == "group":
+            fill = pd.DataFrame(
+                {c: chunk[group_col].map(stats[c]) for c in columns},
+                index=chunk.index,
+            )
+            yield chunk.fillna(fill)
+        else:
+            yield chunk.fillna(stats.to_dict())
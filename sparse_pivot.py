@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+
+class SparsePivot:
+    """
+    A pivot table stored as COO triplets (row code, column code, value) over
+    the non-empty cells only, in row-major order. Row and column labels are
+    decoded lazily, one page at a time, so the dense grid is never built.
+    """
+
+    def __init__(self, rows, cols, data, row_labels, col_labels, columns, values):
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+        self.row_labels = row_labels  # DataFrame of row keys, indexed by row code
+        self.col_labels = col_labels  # Index of column-key values, by column code
+        self.columns = columns
+        self.values = values
+
+    @property
+    def shape(self):
+        return (len(self.row_labels), len(self.col_labels))
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def density(self):
+        n_rows, n_cols = self.shape
+        return self.nnz / (n_rows * n_cols) if n_rows and n_cols else 0.0
+
+    def count_rows(self):
+        return self.nnz
+
+    def execute_page(self, start, stop):
+        """Returns non-empty cells [start, stop) as (row keys, column key, value)."""
+        rows = self.rows[start:stop]
+        page = self.row_labels.iloc[rows].reset_index(drop=True)
+        page[self.columns] = self.col_labels.take(self.cols[start:stop])
+        page[self.values] = self.data[start:stop]
+        return page
+
+
+def sparse_pivot(df, index, columns, values, aggfunc="mean"):
+    """
+    Pivots `values` by `index` (one or more row keys) and `columns` using
+    categorical codes, aggregating only the (row, column) pairs that occur.
+    Rows with a missing key are dropped, as in pandas.pivot_table.
+    """
+    index = [index] if isinstance(index, str) else list(index)
+    if columns in index:
+        raise ValueError("The column key cannot also be a row key.")
+    if values in index or values == columns:
+        raise ValueError("The value column cannot also be a row or column key.")
+
+    # Codes are taken after dropping missing keys, so they stay dense and line
+    # up with the row labels built from the same rows
+    valid = df[index].notna().all(axis=1) & df[columns].notna()
+    df = df[valid]
+    row_codes = df.groupby(index, sort=True).ngroup().to_numpy()
+    col_codes, col_labels = pd.factorize(df[columns], sort=True)
+    n_cols = len(col_labels)
+
+    row_labels = (
+        df[index]
+        .assign(_code=row_codes)
+        .drop_duplicates("_code")
+        .set_index("_code")
+        .sort_index()
+    )
+
+    # One flat cell id per (row, column) pair; grouping on it yields COO in
+    # row-major order without allocating the n_rows x n_cols grid.
+    cell_ids = row_codes.astype(np.int64) * n_cols + col_codes
+    cells = pd.Series(df[values].to_numpy()).groupby(cell_ids).agg(aggfunc)
+    cells = cells.dropna()
+    cell_ids = cells.index.to_numpy()
+
+    return SparsePivot(
+        rows=cell_ids // n_cols,
+        cols=cell_ids % n_cols,
+        data=cells.to_numpy(),
+        row_labels=row_labels,
+        col_labels=col_labels,
+        columns=columns,
+        values=values,
+    )
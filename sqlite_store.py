@@ -0,0 +1,567 @@
+import math
+import os
+import sqlite3
+import tempfile
+
+import pandas as pd
+
+
+class SQLiteStore:
+    """
+    On-disk storage backend for DatasetVisualizerApp.
+    Streams a CSV into a local SQLite database and serves pages, summaries
+    and aggregations through SQL so memory stays flat for large datasets.
+    """
+
+    TABLE = "data"
+    ROWID = "__row_id__"  # INTEGER PRIMARY KEY, i.e. an alias for SQLite's rowid
+
+    AGG_FUNCS = {
+        "mean": "AVG",
+        "sum": "SUM",
+        "count": "COUNT",
+        "min": "MIN",
+        "max": "MAX",
+    }
+    FILTER_OPS = {
+        "==": "=",
+        "!=": "!=",
+        ">": ">",
+        ">=": ">=",
+        "<": "<",
+        "<=": "<=",
+        "contains": "instr",
+    }
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            fd, db_path = tempfile.mkstemp(suffix=".sqlite", prefix="zerocode_")
+            os.close(fd)
+            self._owns_file = True
+        else:
+            self._owns_file = False
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        self.columns = []
+        self.column_types = {}  # column -> "INTEGER" | "REAL" | "TEXT"
+        self._indexes = {}  # column -> index name
+        self._index_counter = 0
+
+        # --- View State (sort + filter applied to pages) ---
+        self.sort_col = None
+        self.sort_ascending = True
+        self.filter_sql = ""
+        self.filter_params = ()
+
+    # --- Loading ---
+
+    @staticmethod
+    def _quote(name):
+        """Quotes an identifier for safe use in SQL."""
+        return '"' + str(name).replace('"', '""') + '"'
+
+    @staticmethod
+    def _sql_type(dtype):
+        if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+            return "INTEGER"
+        if pd.api.types.is_float_dtype(dtype):
+            return "REAL"
+        return "TEXT"
+
+    @staticmethod
+    def _widen(old, new):
+        """The narrowest type that holds both: INTEGER < REAL < TEXT."""
+        order = ("INTEGER", "REAL", "TEXT")
+        return order[max(order.index(old), order.index(new))]
+
+    def _create_table(self, name):
+        q = self._quote
+        col_defs = ", ".join(f"{q(c)} {self.column_types[c]}" for c in self.columns)
+        self.conn.execute(
+            f"CREATE TABLE {name} ({q(self.ROWID)} INTEGER PRIMARY KEY, {col_defs})"
+        )
+
+    def _retype_table(self):
+        """Recreates the table so its declared types match self.column_types."""
+        tmp = f"{self.TABLE}_retyped"
+        with self.conn:
+            self.conn.execute(f"DROP TABLE IF EXISTS {tmp}")
+            self._create_table(tmp)
+            self.conn.execute(f"INSERT INTO {tmp} SELECT * FROM {self.TABLE}")
+            self.conn.execute(f"DROP TABLE {self.TABLE}")
+            self.conn.execute(f"ALTER TABLE {tmp} RENAME TO {self.TABLE}")
+
+    def load_csv(self, csv_path, chunksize=50_000):
+        """
+        Loads a CSV into the store chunk by chunk using bulk executemany inserts.
+        Returns the number of rows loaded.
+        """
+        q = self._quote
+        self.conn.execute(f"DROP TABLE IF EXISTS {self.TABLE}")
+        self._indexes.clear()
+        self.clear_sort()
+        self.clear_filter()
+
+        insert_sql = None
+        declared = {}
+        total = 0
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            chunk_types = {str(c): self._sql_type(chunk[c].dtype) for c in chunk}
+            if insert_sql is None:
+                self.columns = [str(c) for c in chunk.columns]
+                self.column_types = dict(chunk_types)
+                declared = dict(chunk_types)
+                self._create_table(self.TABLE)
+                placeholders = ", ".join("?" for _ in self.columns)
+                col_list = ", ".join(q(c) for c in self.columns)
+                insert_sql = (
+                    f"INSERT INTO {self.TABLE} ({col_list}) VALUES ({placeholders})"
+                )
+            else:
+                # Later chunks can widen a type, e.g. text after leading NULLs
+                for c, sql_type in chunk_types.items():
+                    self.column_types[c] = self._widen(self.column_types[c], sql_type)
+            # Object dtype turns numpy scalars into Python ones sqlite3 can bind
+            rows = chunk.astype(object).where(chunk.notna(), None)
+            with self.conn:
+                self.conn.executemany(
+                    insert_sql, rows.itertuples(index=False, name=None)
+                )
+            total += len(chunk)
+        if self.column_types != declared:
+            self._retype_table()
+        return total
+
+    def close(self):
+        self.conn.close()
+        if self._owns_file:
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.db_path + suffix)
+                except OSError:
+                    pass
+
+    # --- Indexes ---
+
+    def ensure_index(self, col):
+        """Creates an index on a column the user sorts or filters by."""
+        if col in self._indexes:
+            return
+        self._index_counter += 1
+        name = f"idx_{self.TABLE}_{self._index_counter}"
+        with self.conn:
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} "
+                f"ON {self.TABLE} ({self._quote(col)})"
+            )
+        self._indexes[col] = name
+
+    def _drop_index(self, col):
+        name = self._indexes.pop(col, None)
+        if name is not None:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+    # --- View State ---
+
+    def is_numeric(self, col):
+        return self.column_types.get(col) in ("INTEGER", "REAL")
+
+    def set_sort(self, col, ascending=True):
+        self.ensure_index(col)
+        self.sort_col = col
+        self.sort_ascending = ascending
+
+    def clear_sort(self):
+        self.sort_col = None
+        self.sort_ascending = True
+
+    def set_filter(self, col, op, value):
+        """Restricts pages to rows where `col op value` holds."""
+        if op not in self.FILTER_OPS:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        col_sql = self._quote(col)
+        if op == "contains":
+            # Literal, case-sensitive substring match, like the in-memory filter
+            self.filter_sql = f"instr(CAST({col_sql} AS TEXT), ?) > 0"
+            self.filter_params = (str(value),)
+            return
+        if self.is_numeric(col):
+            value = float(value)
+        self.ensure_index(col)
+        self.filter_sql = f"{col_sql} {self.FILTER_OPS[op]} ?"
+        self.filter_params = (value,)
+
+    def clear_filter(self):
+        self.filter_sql = ""
+        self.filter_params = ()
+
+    def _where(self, *conditions, apply_filter=True):
+        parts = [c for c in conditions if c]
+        if apply_filter and self.filter_sql:
+            parts.insert(0, self.filter_sql)
+        return " WHERE " + " AND ".join(f"({p})" for p in parts) if parts else ""
+
+    def _order_by(self, reverse=False):
+        rowid = self._quote(self.ROWID)
+        if self.sort_col is None:
+            return f" ORDER BY {rowid} {'DESC' if reverse else 'ASC'}"
+        ascending = self.sort_ascending != reverse
+        direction = "ASC" if ascending else "DESC"
+        rowid_direction = "DESC" if reverse else "ASC"
+        return (
+            f" ORDER BY {self._quote(self.sort_col)} {direction}, "
+            f"{rowid} {rowid_direction}"
+        )
+
+    def _select_list(self):
+        return ", ".join(self._quote(c) for c in [self.ROWID] + self.columns)
+
+    # --- Reading ---
+
+    def row_count(self, apply_filter=True):
+        sql = f"SELECT COUNT(*) FROM {self.TABLE}" + self._where(
+            apply_filter=apply_filter
+        )
+        params = self.filter_params if apply_filter else ()
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def shape(self):
+        return (self.row_count(apply_filter=False), len(self.columns))
+
+    def _keyset_condition(self, after_key):
+        """
+        Builds the WHERE clause that resumes the current ordering right after
+        `after_key` (the sort value and row id of the previous page's last row).
+        SQLite sorts NULLs first ascending and last descending.
+        """
+        rowid = self._quote(self.ROWID)
+        if self.sort_col is None:
+            return f"{rowid} > ?", (after_key[1],)
+        col = self._quote(self.sort_col)
+        value, last_rowid = after_key
+        if value is None:
+            if self.sort_ascending:
+                return (
+                    f"({col} IS NULL AND {rowid} > ?) OR {col} IS NOT NULL",
+                    (last_rowid,),
+                )
+            return f"{col} IS NULL AND {rowid} > ?", (last_rowid,)
+        cmp = ">" if self.sort_ascending else "<"
+        cond = f"{col} {cmp} ? OR ({col} = ? AND {rowid} > ?)"
+        if not self.sort_ascending:
+            cond += f" OR {col} IS NULL"
+        return cond, (value, value, last_rowid)
+
+    def fetch_page(self, after_key=None, limit=500):
+        """
+        Returns one page of rows as a DataFrame using keyset pagination, plus
+        the key to pass as `after_key` for the following page.
+        """
+        keyset_sql, keyset_params = "", ()
+        if after_key is not None:
+            keyset_sql, keyset_params = self._keyset_condition(after_key)
+        sql = (
+            f"SELECT {self._select_list()} FROM {self.TABLE}"
+            + self._where(keyset_sql)
+            + self._order_by()
+            + " LIMIT ?"
+        )
+        rows = self.conn.execute(
+            sql, self.filter_params + keyset_params + (limit,)
+        ).fetchall()
+        if not rows:
+            return pd.DataFrame(columns=self.columns), None
+        last = rows[-1]
+        if self.sort_col is None:
+            last_key = (None, last[0])
+        else:
+            last_key = (last[1 + self.columns.index(self.sort_col)], last[0])
+        page_df = pd.DataFrame.from_records(
+            [row[1:] for row in rows], columns=self.columns
+        )
+        return page_df, last_key
+
+    def head(self, n=5):
+        sql = (
+            f"SELECT {self._select_list()} FROM {self.TABLE}"
+            + self._order_by()
+            + " LIMIT ?"
+        )
+        rows = self.conn.execute(sql, (n,)).fetchall()
+        return self._records_to_df(rows)
+
+    def tail(self, n=5):
+        sql = (
+            f"SELECT {self._select_list()} FROM {self.TABLE}"
+            + self._order_by(reverse=True)
+            + " LIMIT ?"
+        )
+        rows = self.conn.execute(sql, (n,)).fetchall()
+        return self._records_to_df(rows[::-1])
+
+    def _records_to_df(self, rows):
+        return pd.DataFrame.from_records(
+            [row[1:] for row in rows],
+            columns=self.columns,
+            index=[row[0] - 1 for row in rows],
+        )
+
+    def iter_chunks(self, chunksize=50_000):
+        """Yields the whole table in the current sort order, chunk by chunk."""
+        sql = (
+            f"SELECT {self._select_list()} FROM {self.TABLE}" + self._order_by()
+        )
+        cursor = self.conn.execute(sql)
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            yield pd.DataFrame.from_records(
+                [row[1:] for row in rows], columns=self.columns
+            )
+
+    def export_csv(self, file_path, chunksize=50_000):
+        header = True
+        with open(file_path, "w", newline="", encoding="utf-8") as f:
+            for chunk in self.iter_chunks(chunksize):
+                chunk.to_csv(f, index=False, header=header)
+                header = False
+        if header:  # Empty table: still write the header row
+            pd.DataFrame(columns=self.columns).to_csv(file_path, index=False)
+
+    # --- Summaries ---
+
+    def dtypes(self):
+        return pd.Series(self.column_types, name="sqlite type")
+
+    def null_counts(self):
+        q = self._quote
+        exprs = ", ".join(f"SUM({q(c)} IS NULL)" for c in self.columns)
+        row = self.conn.execute(f"SELECT {exprs} FROM {self.TABLE}").fetchone()
+        return pd.Series([v or 0 for v in row], index=self.columns)
+
+    def describe(self):
+        """Computes count/mean/std/min/max for numeric columns in SQL."""
+        q = self._quote
+        stats = {}
+        for col in self.columns:
+            if not self.is_numeric(col):
+                continue
+            c = q(col)
+            count, mean, lo, hi = self.conn.execute(
+                f"SELECT COUNT({c}), AVG({c}), MIN({c}), MAX({c}) FROM {self.TABLE}"
+            ).fetchone()
+            std = float("nan")
+            if count and count > 1:
+                # Second pass around the mean keeps precision for large values
+                (sq_dev,) = self.conn.execute(
+                    f"SELECT SUM(({c} - ?) * ({c} - ?)) FROM {self.TABLE}",
+                    (mean, mean),
+                ).fetchone()
+                std = math.sqrt(sq_dev / (count - 1))
+            stats[col] = {
+                "count": count,
+                "mean": mean,
+                "std": std,
+                "min": lo,
+                "max": hi,
+            }
+        return pd.DataFrame(stats, index=["count", "mean", "std", "min", "max"])
+
+    def group_aggregate(self, group_col, agg_col, func):
+        """Pushes a single-key group/aggregate down to SQL."""
+        if func not in self.AGG_FUNCS:
+            raise ValueError(f"Unsupported aggregation: {func}")
+        g, a = self._quote(group_col), self._quote(agg_col)
+        self.ensure_index(group_col)
+        sql = (
+            f"SELECT {g}, {self.AGG_FUNCS[func]}({a}) FROM {self.TABLE} "
+            f"WHERE {g} IS NOT NULL GROUP BY {g} ORDER BY {g}"
+        )
+        rows = self.conn.execute(sql).fetchall()
+        return pd.DataFrame.from_records(rows, columns=[group_col, agg_col])
+
+    def pivot(self, index, columns, values, func):
+        """
+        Pushes a pivot down to SQL. Returns a StorePivot that pages through the
+        (row keys, column key) pairs that occur, one row per non-empty cell.
+        """
+        if func not in self.AGG_FUNCS:
+            raise ValueError(f"Unsupported aggregation: {func}")
+        if columns in index:
+            raise ValueError("The column key cannot also be a row key.")
+        if values in index or values == columns:
+            raise ValueError("The value column cannot also be a row or column key.")
+        return StorePivot(self, index, columns, values, func)
+
+    def value_counts(self, col, n=20):
+        c = self._quote(col)
+        sql = (
+            f"SELECT {c}, COUNT(*) AS n FROM {self.TABLE} WHERE {c} IS NOT NULL "
+            f"GROUP BY {c} ORDER BY n DESC LIMIT ?"
+        )
+        rows = self.conn.execute(sql, (n,)).fetchall()
+        return pd.Series(
+            [r[1] for r in rows], index=[r[0] for r in rows], name=col
+        )
+
+    def histogram(self, col, bins=30):
+        """Returns (counts, edges) for a numeric column, binned in SQL."""
+        c = self._quote(col)
+        lo, hi = self.conn.execute(
+            f"SELECT MIN({c}), MAX({c}) FROM {self.TABLE}"
+        ).fetchone()
+        if lo is None:
+            return [], []
+        width = (hi - lo) / bins or 1.0
+        rows = self.conn.execute(
+            f"SELECT MIN(CAST(({c} - ?) / ? AS INTEGER), ?) AS b, COUNT(*) "
+            f"FROM {self.TABLE} WHERE {c} IS NOT NULL GROUP BY b",
+            (lo, width, bins - 1),
+        ).fetchall()
+        counts = [0] * bins
+        for b, n in rows:
+            counts[b] = n
+        edges = [lo + i * width for i in range(bins + 1)]
+        return counts, edges
+
+    def read_columns(self, cols, max_points=10_000):
+        """
+        Reads columns for plotting in the current sort order. Rows are
+        downsampled in SQL to every n-th one, so at most `max_points` load.
+        """
+        stride = max(1, math.ceil(self.row_count(apply_filter=False) / max_points))
+        col_list = ", ".join(self._quote(c) for c in cols)
+        sql = (
+            f"SELECT {col_list} FROM (SELECT {col_list}, "
+            f"ROW_NUMBER() OVER ({self._order_by().strip()}) AS n FROM {self.TABLE}) "
+            f"WHERE (n - 1) % ? = 0 ORDER BY n"
+        )
+        return pd.DataFrame.from_records(
+            self.conn.execute(sql, (stride,)).fetchall(), columns=cols
+        )
+
+    # --- Cleaning ---
+
+    def drop_column(self, col):
+        self._drop_index(col)
+        with self.conn:
+            self.conn.execute(
+                f"ALTER TABLE {self.TABLE} DROP COLUMN {self._quote(col)}"
+            )
+        self.columns.remove(col)
+        self.column_types.pop(col, None)
+        if self.sort_col == col:
+            self.clear_sort()
+        self.clear_filter()
+
+    def drop_duplicates(self):
+        """Deletes duplicate rows, keeping the first one. Returns rows removed."""
+        col_list = ", ".join(self._quote(c) for c in self.columns)
+        rowid = self._quote(self.ROWID)
+        with self.conn:
+            cursor = self.conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE {rowid} NOT IN "
+                f"(SELECT MIN({rowid}) FROM {self.TABLE} GROUP BY {col_list})"
+            )
+        return cursor.rowcount
+
+    def drop_na(self, columns):
+        """Deletes rows with a NULL in any of `columns`. Returns rows removed."""
+        any_null = " OR ".join(f"{self._quote(c)} IS NULL" for c in columns)
+        with self.conn:
+            cursor = self.conn.execute(f"DELETE FROM {self.TABLE} WHERE {any_null}")
+        return cursor.rowcount
+
+    def fill_na(self, fills):
+        """Fills NULLs in several columns with one UPDATE (fills: column -> value)."""
+        fills = {c: v for c, v in fills.items() if v is not None}
+        if not fills:
+            return
+        q = self._quote
+        assignments = ", ".join(f"{q(c)} = COALESCE({q(c)}, ?)" for c in fills)
+        any_null = " OR ".join(f"{q(c)} IS NULL" for c in fills)
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE {self.TABLE} SET {assignments} WHERE {any_null}",
+                tuple(fills.values()),
+            )
+
+    def column_stats(self, columns, stat):
+        """Returns {column: mean/median/mode} computed in SQL."""
+        q = self._quote
+        if stat == "mean":
+            exprs = ", ".join(f"AVG({q(c)})" for c in columns)
+            row = self.conn.execute(f"SELECT {exprs} FROM {self.TABLE}").fetchone()
+            return dict(zip(columns, row))
+        stats = {}
+        for col in columns:
+            c = q(col)
+            if stat == "mode":
+                row = self.conn.execute(
+                    f"SELECT {c} FROM {self.TABLE} WHERE {c} IS NOT NULL "
+                    f"GROUP BY {c} ORDER BY COUNT(*) DESC, {c} LIMIT 1"
+                ).fetchone()
+                stats[col] = row[0] if row else None
+            elif stat == "median":
+                # Average of the middle one or two values, read through the index
+                self.ensure_index(col)
+                n = self.conn.execute(
+                    f"SELECT COUNT({c}) FROM {self.TABLE}"
+                ).fetchone()[0]
+                middle = self.conn.execute(
+                    f"SELECT AVG(v) FROM (SELECT {c} AS v FROM {self.TABLE} "
+                    f"WHERE {c} IS NOT NULL ORDER BY {c} LIMIT ? OFFSET ?)",
+                    (2 - n % 2, (n - 1) // 2),
+                ).fetchone()
+                stats[col] = middle[0] if n else None
+            else:
+                raise ValueError(f"Unsupported statistic: {stat}")
+        return stats
+
+
+class StorePivot:
+    """
+    A pivot over a SQLiteStore, paged like the store itself: every page is a
+    GROUP BY query that resumes after the previous page's keys (keyset), so
+    only the visible cells are ever read into memory.
+    """
+
+    def __init__(self, store, index, columns, values, func):
+        self.store = store
+        self.keys = list(index) + [columns]
+        self.values = values
+        self.func = func
+        quoted = [store._quote(k) for k in self.keys]
+        self._key_list = ", ".join(quoted)
+        self._not_null = " AND ".join(f"{k} IS NOT NULL" for k in quoted)
+
+    def row_count(self):
+        sql = (
+            f"SELECT COUNT(*) FROM (SELECT 1 FROM {self.store.TABLE} "
+            f"WHERE {self._not_null} GROUP BY {self._key_list})"
+        )
+        return self.store.conn.execute(sql).fetchone()[0]
+
+    def fetch_page(self, after_key=None, limit=500):
+        """Returns one page of cells, plus the keys of its last cell."""
+        where, params = self._not_null, ()
+        if after_key is not None:
+            placeholders = ", ".join("?" for _ in after_key)
+            where += f" AND ({self._key_list}) > ({placeholders})"
+            params = tuple(after_key)
+        agg = self.store.AGG_FUNCS[self.func]
+        sql = (
+            f"SELECT {self._key_list}, {agg}({self.store._quote(self.values)}) "
+            f"FROM {self.store.TABLE} WHERE {where} "
+            f"GROUP BY {self._key_list} ORDER BY {self._key_list} LIMIT ?"
+        )
+        rows = self.store.conn.execute(sql, params + (limit,)).fetchall()
+        columns = self.keys + [self.values]
+        if not rows:
+            return pd.DataFrame(columns=columns), None
+        page_df = pd.DataFrame.from_records(rows, columns=columns)
+        return page_df, rows[-1][: len(self.keys)]
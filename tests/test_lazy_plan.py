@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+
+from lazy_plan import LazyPlan
+
+
+@pytest.fixture
+def left():
+    return pd.DataFrame(
+        {
+            "key": [1, 2, 3, 4, 2, 5],
+            "a": [10, 20, 30, 40, 50, 60],
+            "b": [1.0, None, 3.0, None, 5.0, 6.0],
+            "g": ["x", "y", "x", "y", "x", "y"],
+        }
+    )
+
+
+@pytest.fixture
+def right():
+    return pd.DataFrame({"key": [1, 2, 3, 5], "a": [7, 8, 9, 6], "c": [1, 2, 3, 4]})
+
+
+def unoptimized(plan):
+    return plan._apply_steps(plan.source, plan.steps)
+
+
+def assert_same_rows(plan):
+    expected = unoptimized(plan).reset_index(drop=True)
+    pd.testing.assert_frame_equal(plan.collect().reset_index(drop=True), expected)
+
+
+def test_filter_on_suffixed_column_stays_above_merge(left, right):
+    plan = LazyPlan(left).merge(right, on="key").query("a_x > 15")
+    assert [s.op for s in plan.optimized_steps()] == ["merge", "filter"]
+    assert_same_rows(plan)
+
+
+def test_left_filter_is_pushed_below_merge(left, right):
+    plan = LazyPlan(left).merge(right, on="key").query("g == 'x'")
+    assert [s.op for s in plan.optimized_steps()] == ["filter", "merge"]
+    assert_same_rows(plan)
+
+
+def test_filter_is_not_pushed_when_later_steps_use_row_labels(left, right):
+    plan = LazyPlan(left).merge(right, on="key").query("g == 'x'").drop_rows([2])
+    assert [s.op for s in plan.optimized_steps()] == ["merge", "filter", "drop_rows"]
+    pd.testing.assert_frame_equal(plan.collect(), unoptimized(plan))
+
+    plan = LazyPlan(left).merge(right, on="key").query("g == 'x'").query("index > 1")
+    assert plan.optimized_steps()[0].op == "merge"
+    pd.testing.assert_frame_equal(plan.collect(), unoptimized(plan))
+
+
+def test_projections_are_merged_and_pushed(left, right):
+    plan = LazyPlan(left).merge(right, on="key").drop_columns(["g"]).drop_columns(["c"])
+    steps = plan.optimized_steps()
+    assert [s.op for s in steps] == ["project", "merge"]
+    assert steps[1].params["right_drop"] == ["c"]
+    pd.testing.assert_frame_equal(plan.collect(), unoptimized(plan))
+
+
+def test_sort_before_groupby_is_elided(left):
+    plan = LazyPlan(left).sort("a", ascending=False).groupby_agg("g", "a", "sum")
+    assert [s.op for s in plan.optimized_steps()] == ["groupby_agg"]
+    pd.testing.assert_frame_equal(plan.collect(), unoptimized(plan))
+
+
+def test_sort_is_kept_before_ffill(left):
+    plan = LazyPlan(left).sort("a", ascending=False).fillna(["b"], "ffill")
+    plan = plan.groupby_agg("g", "b", "sum")
+    assert "sort" in [s.op for s in plan.optimized_steps()]
+    pd.testing.assert_frame_equal(plan.collect(), unoptimized(plan))
+
+
+def test_streamed_pages_match_collect(left):
+    plan = LazyPlan(left, chunksize=2).query("a > 15").fillna(["b"], value=0)
+    for start, stop in [(0, 2), (1, 4), (3, 10)]:
+        page = plan.execute_page(start, stop)
+        pd.testing.assert_frame_equal(page, unoptimized(plan).iloc[start:stop])
+    assert plan.count_rows() == len(unoptimized(plan))
+
+
+def test_astype_is_checked_against_the_source_without_running_the_plan(left):
+    plan = LazyPlan(left)
+    with pytest.raises(Exception):
+        plan.astype("b", "int")
+    # Once an earlier step changes the column, the cast is only checked at run
+    cast = plan.dropna().astype("b", "int")
+    assert cast._result is None and plan._result is None
+    assert cast.collect()["b"].dtype == int
+
+
+def test_filter_below_sort_keeps_tied_rows_in_order():
+    n = 5_000
+    df = pd.DataFrame({"k": [i % 3 for i in range(n)], "a": range(n)})
+    plan = LazyPlan(df).sort("k").filter("a", ">", "50")
+    assert [s.op for s in plan.optimized_steps()] == ["filter", "sort"]
+    pd.testing.assert_frame_equal(plan.collect(), unoptimized(plan))
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from missing_data import fill_missing, iter_fill_missing
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 50
+    df = pd.DataFrame(
+        {
+            "a": rng.integers(0, 5, n).astype(float),
+            "b": rng.normal(size=n),
+            "z": np.nan,  # All-null column
+            "g": rng.choice(["x", "y", "w"], n),
+        }
+    )
+    df.loc[rng.random(n) < 0.3, "a"] = np.nan
+    df.loc[rng.random(n) < 0.3, "b"] = np.nan
+    df.loc[:4, "a"] = np.nan  # Leading and trailing gaps cross chunk boundaries
+    df.loc[45:, "b"] = np.nan
+    return df
+
+
+def chunked(df, size):
+    return lambda: (df.iloc[i : i + size] for i in range(0, len(df), size))
+
+
+@pytest.mark.parametrize("size", [1, 7, 100])
+@pytest.mark.parametrize(
+    "strategy, options",
+    [
+        ("drop", {}),
+        ("value", {"value": "0"}),
+        ("mean", {}),
+        ("median", {}),
+        ("mode", {}),
+        ("ffill", {}),
+        ("bfill", {}),
+        ("group", {"group_col": "g", "group_stat": "mean"}),
+        ("group", {"group_col": "g", "group_stat": "median"}),
+    ],
+)
+def test_chunked_fill_matches_fill_missing(df, size, strategy, options):
+    columns = ["a", "b", "z"]
+    expected = fill_missing(df, columns, strategy, **options)
+    chunks = iter_fill_missing(chunked(df, size), columns, strategy, **options)
+    result = pd.concat(chunks)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("strategy", ["mean", "median", "mode", "ffill", "bfill"])
+def test_no_chunks_yields_nothing(strategy):
+    assert list(iter_fill_missing(lambda: iter([]), ["a"], strategy)) == []
+
+
+@pytest.mark.parametrize("group_stat", ["mean", "median"])
+def test_group_fill_with_no_chunks_yields_nothing(group_stat):
+    chunks = iter_fill_missing(
+        lambda: iter([]), ["a"], "group", group_col="g", group_stat=group_stat
+    )
+    assert list(chunks) == []
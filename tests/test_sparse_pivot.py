@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sparse_pivot import sparse_pivot
+
+
+def to_series(pivot):
+    page = pivot.execute_page(0, pivot.count_rows())
+    return page.set_index(list(pivot.row_labels.columns) + [pivot.columns])[
+        pivot.values
+    ]
+
+
+def test_rows_dropped_for_missing_keys_keep_labels_aligned():
+    df = pd.DataFrame(
+        {
+            "r": ["a", "b", "c", "c", "d"],
+            "c": [None, "x", "y", "x", "x"],
+            "v": [1, 2, 3, 4, 5],
+        }
+    )
+    pivot = sparse_pivot(df, "r", "c", "v", aggfunc="sum")
+    page = pivot.execute_page(0, pivot.count_rows())
+    assert page.values.tolist() == [
+        ["b", "x", 2],
+        ["c", "x", 4],
+        ["c", "y", 3],
+        ["d", "x", 5],
+    ]
+
+
+@pytest.mark.parametrize("aggfunc", ["mean", "sum", "count", "min", "max"])
+def test_matches_pivot_table(aggfunc):
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame(
+        {
+            "r1": rng.choice(["a", "b", "c", None], n),
+            "r2": rng.integers(0, 4, n),
+            "c": rng.choice(["p", "q", "s", None], n),
+            "v": rng.normal(size=n),
+        }
+    )
+    df.loc[rng.random(n) < 0.1, "v"] = np.nan
+    pivot = sparse_pivot(df, ["r1", "r2"], "c", "v", aggfunc=aggfunc)
+    expected = (
+        df.pivot_table(index=["r1", "r2"], columns="c", values="v", aggfunc=aggfunc)
+        .stack()
+        .dropna()  # Empty cells are not stored in the sparse form
+        .rename("v")
+    )
+    result = to_series(pivot)
+    pd.testing.assert_series_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("values", ["r", "c"])
+def test_value_column_cannot_be_a_key(values):
+    df = pd.DataFrame({"r": [1, 2], "c": ["x", "y"]})
+    with pytest.raises(ValueError):
+        sparse_pivot(df, "r", "c", values, aggfunc="count")
@@ -0,0 +1,98 @@
+import os
+
+import pandas as pd
+import pytest
+
+from lazy_plan import filter_mask
+from sqlite_store import SQLiteStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    df = pd.DataFrame(
+        {
+            "k": [3, 1, None, 2, 1, None, 3],
+            "v": [1e9 + i for i in range(7)],
+            "s": ["Ab%", "ab_", "xAb", "a%b", "q", None, "AB"],
+        }
+    )
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    store = SQLiteStore()
+    store.load_csv(path, chunksize=3)
+    yield store, pd.read_csv(path)
+    store.close()
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_keyset_pages_cover_every_row_once(store, ascending):
+    store, df = store
+    store.set_sort("k", ascending=ascending)
+    pages, key = [], None
+    while True:
+        page, key = store.fetch_page(key, limit=2)
+        if key is None:
+            break
+        pages.append(page)
+    result = pd.concat(pages, ignore_index=True)
+    assert len(result) == len(df)
+    assert sorted(result["v"]) == sorted(df["v"])
+
+
+def test_describe_std_keeps_precision_for_large_values(store):
+    store, df = store
+    assert store.describe().loc["std", "v"] == pytest.approx(df["v"].std())
+
+
+@pytest.mark.parametrize("value", ["Ab", "%", "_", "ab"])
+def test_contains_filter_matches_in_memory_filter(store, value):
+    store, df = store
+    store.set_filter("s", "contains", value)
+    expected = filter_mask(df, "s", "contains", value).sum()
+    assert store.row_count() == expected
+
+
+def test_close_removes_temporary_database():
+    store = SQLiteStore()
+    path = store.db_path
+    store.close()
+    assert not os.path.exists(path)
+
+
+def test_types_are_widened_across_chunks(tmp_path):
+    path = tmp_path / "mixed.csv"
+    pd.DataFrame(
+        {"a": [None, None, "x", "y"], "b": [1, 2, None, 4], "c": [1, 2, 3, 4]}
+    ).to_csv(path, index=False)
+    store = SQLiteStore()
+    store.load_csv(path, chunksize=2)
+    try:
+        assert store.column_types == {"a": "TEXT", "b": "REAL", "c": "INTEGER"}
+        assert list(store.describe().columns) == ["b", "c"]
+        types = store.conn.execute("SELECT DISTINCT typeof(b) FROM data").fetchall()
+        assert sorted(types) == [("null",), ("real",)]
+    finally:
+        store.close()
+
+
+def test_pivot_pages_by_keyset(store):
+    store, df = store
+    pivot = store.pivot(["k"], "s", "v", "sum")
+    expected = df.dropna(subset=["k", "s"]).groupby(["k", "s"])["v"].sum()
+    pages, key = [], None
+    while True:
+        page, key = pivot.fetch_page(key, limit=2)
+        if key is None:
+            break
+        assert len(page) <= 2
+        pages.append(page)
+    result = pd.concat(pages).set_index(["k", "s"])["v"]
+    assert pivot.row_count() == len(expected)
+    pd.testing.assert_series_equal(result, expected, check_index_type=False)
+
+
+def test_read_columns_is_downsampled_in_order(store):
+    store, df = store
+    store.set_sort("v", ascending=False)
+    sample = store.read_columns(["v"], max_points=3)
+    assert sample["v"].tolist() == sorted(df["v"], reverse=True)[::3]